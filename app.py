@@ -1,187 +1,528 @@
-import json
-import os
-from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
-
-# Serve static files (index.html, admin.html) from this folder
-app = Flask(__name__, static_folder='.', static_url_path='')
-CORS(app)
-app.url_map.strict_slashes = False  # accept both /path and /path/
-
-DONOR_DATA = []
-DATA_FILE = 'donors.json'
-AVAILABLE_KEY = 'AVAILABLE'  # used for comparisons in upper-case
-
-
-# ---------- Load & Save Helpers ----------
-
-def load_donor_data():
-    """Load donors.json into DONOR_DATA."""
-    global DONOR_DATA
-    try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        file_path = os.path.join(current_dir, DATA_FILE)
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if content.startswith('\ufeff'):  # strip BOM if present
-                content = content.lstrip('\ufeff')
-            DONOR_DATA = json.loads(content)
-
-        print(f"✅ Loaded {len(DONOR_DATA)} donors from {DATA_FILE}")
-
-    except FileNotFoundError:
-        print(f"⚠️ {DATA_FILE} not found, starting with empty list.")
-        DONOR_DATA = []
-    except json.JSONDecodeError:
-        print(f"⚠️ JSON decode error in {DATA_FILE}, starting empty.")
-        DONOR_DATA = []
-
-
-def save_donor_data():
-    """Persist DONOR_DATA back to donors.json."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(current_dir, DATA_FILE)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(DONOR_DATA, f, indent=4)
-
-
-def next_id():
-    """Return the next integer id."""
-    return max((int(d.get('id', 0)) for d in DONOR_DATA), default=0) + 1
-
-
-# ---------- Static Routes ----------
-
-@app.route('/')
-def serve_index():
-    return send_from_directory('.', 'index.html')
-
-
-@app.route('/admin')
-def serve_admin():
-    return send_from_directory('.', 'admin.html')
-
-
-# ---------- API: Status ----------
-
-@app.route('/api/status')
-def status():
-    return jsonify({
-        "app_version": "1.4",
-        "donor_count": len(DONOR_DATA),
-        "status": "Server is running ✅"
-    })
-
-
-# ---------- API: Search Donors ----------
-
-@app.route('/api/donors/search', methods=['GET'])
-def search_donors():
-    """
-    - No params -> return ALL donors (admin page).
-    - blood_group=X -> return donors with that group AND Availability_Status == 'Available' (public).
-    - Optional name=... -> substring, case-insensitive (works with or without blood_group).
-    """
-    blood_group_input = request.args.get('blood_group')
-    name_input = request.args.get('name')
-
-    # No filters: return all (used by admin)
-    if not blood_group_input and not name_input:
-        return jsonify(DONOR_DATA)
-
-    bg_key = (blood_group_input or '').strip().upper()
-    name_key = (name_input or '').strip().upper()
-
-    results = []
-    for donor in DONOR_DATA:
-        donor_blood = (donor.get('Blood_Group') or '').strip().upper()
-        donor_name = (donor.get('Name') or '').strip().upper()
-        avail = (donor.get('Availability_Status') or 'Unavailable').strip().upper()
-
-        # If blood group is provided, enforce AVAILABLE (public search behavior)
-        if bg_key:
-            if donor_blood != bg_key:
-                continue
-            if avail != AVAILABLE_KEY:
-                continue
-
-        # If name filter present, do case-insensitive substring match
-        if name_key and name_key not in donor_name:
-            continue
-
-        results.append(donor)
-
-    return jsonify(results)
-
-
-# ---------- API: Create Donor ----------
-
-@app.route('/api/donors', methods=['POST', 'OPTIONS'])
-@app.route('/api/donors/register', methods=['POST', 'OPTIONS'])
-def create_donor():
-    # Handle preflight for CORS
-    if request.method == 'OPTIONS':
-        return ('', 204)
-
-    data = request.get_json(silent=True) or request.form.to_dict()
-
-    # Required fields (match your frontend)
-    required = ['Name', 'Phone_Number', 'Blood_Group']
-    missing = [f for f in required if not (data.get(f))]
-    if missing:
-        return jsonify({"error": f"Missing fields: {', '.join(missing)}"}), 400
-
-    # Accept either City or Address from clients; always store as Address
-    address = (data.get('Address') or data.get('City') or '').strip()
-
-    donor = {
-        "id": next_id(),
-        "Name": str(data['Name']).strip(),
-        "Phone_Number": str(data['Phone_Number']).strip(),
-        # normalize blood group in storage as uppercase like your JSON uses (A+, AB+ ...)
-        "Blood_Group": str(data['Blood_Group']).strip().upper(),
-        # keep pretty case for display; searching upper-cases internally
-        "Availability_Status": (data.get('Availability_Status') or 'Available').strip().capitalize(),
-        "Address": address
-    }
-
-    DONOR_DATA.append(donor)
-    save_donor_data()
-
-    return jsonify(donor), 201
-
-
-# ---------- API: Update Availability ----------
-
-@app.route('/api/donors/update_status', methods=['POST'])
-def update_status():
-    try:
-        data = request.get_json()
-        donor_id = data.get('id')
-        new_status = data.get('new_status')
-
-        if not donor_id or not new_status:
-            return jsonify({"error": "Missing 'id' or 'new_status'."}), 400
-
-        for donor in DONOR_DATA:
-            if str(donor.get('id')) == str(donor_id):
-                donor['Availability_Status'] = str(new_status).strip().capitalize()
-                save_donor_data()
-                return jsonify({"success": True, "message": "Status updated."})
-
-        return jsonify({"error": "Donor not found."}), 404
-
-    except Exception as e:
-        print("Update error:", e)
-        return jsonify({"error": "Internal server error."}), 500
-
-
-# ---------- Main ----------
-
-if __name__ == '__main__':
-    load_donor_data()
-    port = int(os.environ.get('PORT', 5000))
-    app.run(debug=True, host='0.0.0.0', port=port)
-else:
-    load_donor_data()
+import gzip
+import hashlib
+import mmap
+import os
+import queue
+import sys
+import tempfile
+import threading
+from collections import defaultdict
+
+import orjson
+from flask import Flask, request, send_from_directory, stream_with_context
+from flask_cors import CORS
+
+try:
+    import msgpack  # snapshot format: smaller files, faster reload than JSON
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy as np  # optional: vectorized search path for big donor tables
+except ImportError:
+    np = None
+
+# Serve static files (index.html, admin.html) from this folder
+app = Flask(__name__, static_folder='.', static_url_path='')
+CORS(app)
+app.url_map.strict_slashes = False  # accept both /path and /path/
+app.json.compact = True  # never pretty-print, even in debug mode
+
+DONOR_DATA = []
+BG_INDEX = defaultdict(list)  # Blood_Group (upper) -> [donor, ...]
+SEARCHERS = {}  # Blood_Group (upper) -> closure returning its AVAILABLE donors
+ID_INDEX = {}  # int id -> donor
+NEXT_ID = 1  # monotonic id counter, set once at load
+ID_LOCK = threading.Lock()  # concurrent POSTs must not hand out the same id
+DATA_LOCK = threading.Lock()  # guards DONOR_DATA mutation vs. snapshot copies
+ALL_DONORS_JSON = b'[]'  # pre-serialized "return all" payload for the admin page
+ALL_DONORS_GZIP = gzip.compress(ALL_DONORS_JSON)
+DATA_VERSION = ''  # short content hash, bumped on every mutation (for ETags)
+DATA_FILE = 'donors.json'  # JSON snapshot: msgpack-less fallback / migration source
+MSGPACK_FILE = 'donors.msgpack'  # preferred snapshot of the full list
+LOG_FILE = 'donors.jsonl'  # append-only upsert log since the last snapshot
+COMPACT_EVERY = 100  # mutations between snapshot+truncate cycles
+LOG_OPS = 0  # upserts sitting in the log
+SAVE_QUEUE = queue.Queue()  # upserts waiting for the write-behind thread
+WRITER_THREAD = None
+LOG_FH = None  # log kept open between appends; only the writer thread touches it
+AVAILABLE_KEY = sys.intern('AVAILABLE')  # used for comparisons in upper-case
+STREAM_THRESHOLD = 500  # above this many results, stream instead of buffering
+NP_MIN_ROWS = 5000  # below this, the indexed pure-Python path is faster
+# The eight canonical groups as small ints; comparing ints beats comparing
+# strings in the hot path. Anything else (typos, rare types) codes to -1.
+BG_CODE = {'A+': 0, 'A-': 1, 'B+': 2, 'B-': 3,
+           'AB+': 4, 'AB-': 5, 'O+': 6, 'O-': 7}
+BG_CODES = None  # np.int8 column of blood-group codes, parallel to DONOR_DATA
+AVAIL_MASK = None  # np.bool_ column: True where donor is AVAILABLE
+
+
+def ojson(obj, status=200):
+    """Build a JSON response via orjson (much faster than jsonify for big lists)."""
+    return app.response_class(orjson.dumps(obj), status=status,
+                              mimetype='application/json')
+
+
+def public_donor(donor):
+    """Donor as served and persisted: the cached underscore keys stay internal."""
+    return {k: v for k, v in donor.items() if not k.startswith('_')}
+
+
+def public_donors(donors):
+    """Strip the cached compare keys from a list of donors."""
+    return [public_donor(d) for d in donors]
+
+
+def json_stream(donors):
+    """Yield a JSON array donor-by-donor so big results never buffer in full."""
+    yield b'['
+    sep = b''
+    for donor in donors:
+        yield sep + orjson.dumps(public_donor(donor))
+        sep = b','
+    yield b']'
+
+
+# ---------- Load & Save Helpers ----------
+
+def data_path(name):
+    """Absolute path for a data file living next to this module."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+
+def normalize_donor(donor):
+    """Cache upper-cased compare keys so searches skip per-request strip/upper.
+
+    Blood group and availability come from tiny value sets, so they are
+    interned: equal strings share one object and == short-circuits on identity.
+    """
+    donor['_bg_u'] = sys.intern((donor.get('Blood_Group') or '').strip().upper())
+    donor['_bg_c'] = BG_CODE.get(donor['_bg_u'], -1)
+    donor['_avail_u'] = sys.intern(
+        (donor.get('Availability_Status') or 'Unavailable').strip().upper())
+    donor['_name_u'] = (donor.get('Name') or '').strip().upper()
+
+
+def refresh_all_donors_cache():
+    """Re-serialize the full list once per mutation instead of once per request."""
+    global ALL_DONORS_JSON, ALL_DONORS_GZIP, DATA_VERSION
+    ALL_DONORS_JSON = orjson.dumps(public_donors(DONOR_DATA))
+    ALL_DONORS_GZIP = gzip.compress(ALL_DONORS_JSON)
+    DATA_VERSION = hashlib.blake2b(ALL_DONORS_JSON, digest_size=8).hexdigest()
+
+
+def cacheable(resp, etag):
+    """Tag a search response so polling clients can get 304s."""
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'private, max-age=5'
+    return resp
+
+
+def rebuild_column_arrays():
+    """Mirror blood-group codes and availability into NumPy columns (SoA).
+
+    Lets big-table searches run as one vectorized mask instead of a Python
+    loop. No-op when numpy is absent; the dict-indexed path covers that.
+    """
+    global BG_CODES, AVAIL_MASK
+    if np is None:
+        return
+    count = len(DONOR_DATA)
+    BG_CODES = np.fromiter((d['_bg_c'] for d in DONOR_DATA),
+                           dtype=np.int8, count=count)
+    AVAIL_MASK = np.fromiter((d['_avail_u'] is AVAILABLE_KEY for d in DONOR_DATA),
+                             dtype=bool, count=count)
+
+
+def rebuild_searchers():
+    """Bake one closure per blood group with its bucket bound as a default.
+
+    Dispatching to a pre-built closure saves the bucket lookup and key test
+    on the common no-name search; the bucket list is shared with BG_INDEX,
+    so in-place appends stay visible without a rebuild.
+    """
+    global SEARCHERS
+    SEARCHERS = {
+        bg: (lambda bucket=bucket, avail=AVAILABLE_KEY:
+             [d for d in bucket if d['_avail_u'] is avail])
+        for bg, bucket in BG_INDEX.items()
+    }
+
+
+def rebuild_indexes():
+    """Recompute BG_INDEX and ID_INDEX so lookups skip the linear scan."""
+    global BG_INDEX, ID_INDEX, NEXT_ID
+    bg_index = defaultdict(list)
+    id_index = {}
+    for donor in DONOR_DATA:
+        normalize_donor(donor)
+        bg_index[donor['_bg_u']].append(donor)
+        id_index[int(donor.get('id', 0))] = donor
+    BG_INDEX = bg_index
+    ID_INDEX = id_index
+    NEXT_ID = max(id_index, default=0) + 1
+    rebuild_searchers()
+    rebuild_column_arrays()
+
+
+def load_donor_data():
+    """Load the donor snapshot (msgpack preferred, donors.json for migration)."""
+    global DONOR_DATA
+    try:
+        if msgpack is not None and os.path.exists(data_path(MSGPACK_FILE)):
+            with open(data_path(MSGPACK_FILE), 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:  # mmap rejects empty files
+                    DONOR_DATA = []
+                else:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        DONOR_DATA = msgpack.unpackb(mm, raw=False)
+                    finally:
+                        mm.close()
+            print(f"✅ Loaded {len(DONOR_DATA)} donors from {MSGPACK_FILE}")
+        else:
+            with open(data_path(DATA_FILE), 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:  # mmap rejects empty files
+                    DONOR_DATA = []
+                else:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    view = memoryview(mm)
+                    try:
+                        if view[:3] == b'\xef\xbb\xbf':  # strip BOM if present
+                            view = view[3:]
+                        DONOR_DATA = orjson.loads(view)
+                    finally:
+                        view.release()  # drop the buffer so the map can close
+                        mm.close()
+            print(f"✅ Loaded {len(DONOR_DATA)} donors from {DATA_FILE}")
+
+    except FileNotFoundError:
+        print(f"⚠️ {DATA_FILE} not found, starting with empty list.")
+        DONOR_DATA = []
+    except ValueError:  # bad JSON or a corrupt msgpack snapshot
+        print("⚠️ Snapshot decode error, starting empty.")
+        DONOR_DATA = []
+
+    replay_log()
+    rebuild_indexes()
+    refresh_all_donors_cache()
+
+
+def save_donor_data():
+    """Snapshot DONOR_DATA via tempfile + os.replace (crash-safe).
+
+    msgpack is the preferred on-disk form (3-5x smaller, faster reload);
+    donors.json remains the format when msgpack is unavailable.
+    """
+    # Copy under the lock: the writer thread must not serialize the live list
+    # while a request thread is appending to it or editing a donor in place.
+    with DATA_LOCK:
+        snapshot = public_donors(DONOR_DATA)
+    if msgpack is not None:
+        file_path = data_path(MSGPACK_FILE)
+        payload = msgpack.packb(snapshot, use_bin_type=True)
+    else:
+        file_path = data_path(DATA_FILE)
+        payload = orjson.dumps(snapshot)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path),
+                                    prefix=os.path.basename(file_path) + '.')
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, file_path)  # atomic: readers see old or new, never torn
+
+
+def replay_log():
+    """Apply upserts appended to donors.jsonl since the last snapshot."""
+    global LOG_OPS
+    try:
+        with open(data_path(LOG_FILE), 'rb') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return
+
+    position = {int(d.get('id', 0)): i for i, d in enumerate(DONOR_DATA)}
+    applied = 0
+    for line in lines:
+        if not line:
+            continue
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue  # torn tail from a crash mid-append; skip it
+        donor = entry.get('donor')
+        if not donor:
+            continue
+        donor_id = int(donor.get('id', 0))
+        if donor_id in position:
+            DONOR_DATA[position[donor_id]] = donor
+        else:
+            position[donor_id] = len(DONOR_DATA)
+            DONOR_DATA.append(donor)
+        applied += 1
+
+    LOG_OPS = applied
+    if applied:
+        print(f"✅ Replayed {applied} upserts from {LOG_FILE}")
+
+
+def log_upsert(donor):
+    """Queue one mutation for the write-behind thread; returns immediately."""
+    # public_donor copies, so later in-place edits can't race the serializer,
+    # and the cached underscore keys never reach the log
+    SAVE_QUEUE.put(public_donor(donor))
+
+
+def log_fh():
+    """Return the shared append handle, opening it on first use."""
+    global LOG_FH
+    if LOG_FH is None or LOG_FH.closed:
+        LOG_FH = open(data_path(LOG_FILE), 'ab')
+    return LOG_FH
+
+
+def write_upsert(donor):
+    """Append one mutation to the log instead of rewriting the whole snapshot."""
+    global LOG_OPS
+    f = log_fh()
+    f.write(orjson.dumps({'op': 'upsert', 'donor': donor}) + b'\n')
+    f.flush()
+    LOG_OPS += 1
+    if LOG_OPS >= COMPACT_EVERY:
+        compact_log()
+
+
+def writer_loop():
+    """Drain SAVE_QUEUE forever, persisting off the request thread."""
+    while True:
+        donor = SAVE_QUEUE.get()
+        try:
+            write_upsert(donor)
+        except OSError as e:
+            print("Writer error:", e)
+        finally:
+            SAVE_QUEUE.task_done()
+
+
+def start_writer():
+    """Start the write-behind persistence thread (idempotent)."""
+    global WRITER_THREAD
+    if WRITER_THREAD is None or not WRITER_THREAD.is_alive():
+        WRITER_THREAD = threading.Thread(target=writer_loop, name='donor-writer',
+                                         daemon=True)
+        WRITER_THREAD.start()
+
+
+def compact_log():
+    """Fold the log into the donors.json snapshot and truncate it."""
+    global LOG_OPS, LOG_FH
+    save_donor_data()
+    if LOG_FH is not None and not LOG_FH.closed:
+        LOG_FH.close()
+    LOG_FH = None
+    open(data_path(LOG_FILE), 'wb').close()
+    LOG_OPS = 0
+
+
+def next_id():
+    """Hand out the next integer id from the counter (O(1), thread-safe)."""
+    global NEXT_ID
+    with ID_LOCK:
+        new_id = NEXT_ID
+        NEXT_ID += 1
+    return new_id
+
+
+# ---------- Static Routes ----------
+
+@app.route('/')
+def serve_index():
+    return send_from_directory('.', 'index.html')
+
+
+@app.route('/admin')
+def serve_admin():
+    return send_from_directory('.', 'admin.html')
+
+
+# ---------- API: Status ----------
+
+@app.route('/api/status')
+def status():
+    return ojson({
+        "app_version": "1.4",
+        "donor_count": len(DONOR_DATA),
+        "status": "Server is running ✅"
+    })
+
+
+# ---------- API: Search Donors ----------
+
+@app.route('/api/donors/search', methods=['GET'])
+def search_donors():
+    """
+    - No params -> return ALL donors (admin page).
+    - blood_group=X -> return donors with that group AND Availability_Status == 'Available' (public).
+    - Optional name=... -> substring, case-insensitive (works with or without blood_group).
+    """
+    blood_group_input = request.args.get('blood_group')
+    name_input = request.args.get('name')
+
+    bg_key = sys.intern((blood_group_input or '').strip().upper())
+    name_key = (name_input or '').strip().upper()
+
+    # Same data + same filters -> same ETag; pollers get a cheap 304.
+    # Hashed because the filter keys are user input and raw quotes/control
+    # characters are not valid inside an ETag header.
+    etag = hashlib.blake2b(f"{DATA_VERSION}:{bg_key}:{name_key}".encode(),
+                           digest_size=8).hexdigest()
+    if request.if_none_match.contains(etag):
+        return '', 304
+
+    # No filters: serve the pre-serialized full dump (used by admin)
+    if not blood_group_input and not name_input:
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            resp = app.response_class(ALL_DONORS_GZIP, mimetype='application/json')
+            resp.headers['Content-Encoding'] = 'gzip'
+            resp.headers['Vary'] = 'Accept-Encoding'
+            return cacheable(resp, etag)
+        return cacheable(app.response_class(ALL_DONORS_JSON,
+                                            mimetype='application/json'), etag)
+
+    # Storage is canonical (stripped/upper-cased/interned at load and on
+    # mutation), so these comprehensions compare cached keys only; `is` works
+    # because both sides are interned. Bind every global the loops touch to a
+    # local first — the comprehension bodies then run on LOAD_FAST alone.
+    donors = DONOR_DATA
+    if bg_key:
+        # Blood group given: AVAILABLE donors of that group only (public search)
+        bg_code = BG_CODE.get(bg_key, -1)
+        if BG_CODES is not None and bg_code >= 0 and len(donors) >= NP_MIN_ROWS:
+            # Big table, canonical group: one vectorized mask over int columns
+            mask = (BG_CODES == bg_code) & AVAIL_MASK
+            results = [donors[i] for i in np.nonzero(mask)[0]]
+            if name_key:
+                results = [d for d in results if name_key in d['_name_u']]
+        elif not name_key:
+            # Common case: dispatch to the closure specialized for this group
+            searcher = SEARCHERS.get(bg_key)
+            results = searcher() if searcher is not None else []
+        else:
+            avail = AVAILABLE_KEY
+            bucket = BG_INDEX.get(bg_key, ())
+            results = [d for d in bucket
+                       if d['_avail_u'] is avail
+                       and name_key in d['_name_u']]
+    else:
+        # Name-only search: case-insensitive substring over everyone
+        results = [d for d in donors if name_key in d['_name_u']]
+
+    # Large result sets: stream so the first byte goes out immediately
+    if len(results) > STREAM_THRESHOLD:
+        return cacheable(
+            app.response_class(stream_with_context(json_stream(results)),
+                               mimetype='application/json'), etag)
+    return cacheable(ojson(public_donors(results)), etag)
+
+
+# ---------- API: Create Donor ----------
+
+@app.route('/api/donors', methods=['POST', 'OPTIONS'])
+@app.route('/api/donors/register', methods=['POST', 'OPTIONS'])
+def create_donor():
+    # Handle preflight for CORS
+    if request.method == 'OPTIONS':
+        return ('', 204)
+
+    data = request.get_json(silent=True) or request.form.to_dict()
+
+    # Required fields (match your frontend)
+    required = ['Name', 'Phone_Number', 'Blood_Group']
+    missing = [f for f in required if not (data.get(f))]
+    if missing:
+        return ojson({"error": f"Missing fields: {', '.join(missing)}"}, 400)
+
+    # Accept either City or Address from clients; always store as Address
+    address = (data.get('Address') or data.get('City') or '').strip()
+
+    donor = {
+        "id": next_id(),
+        "Name": str(data['Name']).strip(),
+        "Phone_Number": str(data['Phone_Number']).strip(),
+        # normalize blood group in storage as uppercase like your JSON uses (A+, AB+ ...)
+        "Blood_Group": str(data['Blood_Group']).strip().upper(),
+        # keep pretty case for display; searching upper-cases internally
+        "Availability_Status": (data.get('Availability_Status') or 'Available').strip().capitalize(),
+        "Address": address
+    }
+
+    normalize_donor(donor)
+    with DATA_LOCK:
+        DONOR_DATA.append(donor)
+        if donor['_bg_u'] not in BG_INDEX:
+            BG_INDEX[donor['_bg_u']].append(donor)
+            rebuild_searchers()  # first donor of a new group needs a closure
+        else:
+            BG_INDEX[donor['_bg_u']].append(donor)
+        ID_INDEX[donor['id']] = donor
+        rebuild_column_arrays()
+        refresh_all_donors_cache()
+        log_upsert(donor)
+
+    return ojson(public_donor(donor), 201)
+
+
+# ---------- API: Update Availability ----------
+
+@app.route('/api/donors/update_status', methods=['POST'])
+def update_status():
+    try:
+        data = request.get_json()
+        donor_id = data.get('id')
+        new_status = data.get('new_status')
+
+        if not donor_id or not new_status:
+            return ojson({"error": "Missing 'id' or 'new_status'."}, 400)
+
+        try:
+            donor = ID_INDEX.get(int(donor_id))
+        except (TypeError, ValueError):
+            donor = None
+        if donor is None:
+            return ojson({"error": "Donor not found."}, 404)
+
+        with DATA_LOCK:
+            donor['Availability_Status'] = str(new_status).strip().capitalize()
+            normalize_donor(donor)
+            rebuild_column_arrays()
+            refresh_all_donors_cache()
+            log_upsert(donor)
+        return ojson({"success": True, "message": "Status updated."})
+
+    except Exception as e:
+        print("Update error:", e)
+        return ojson({"error": "Internal server error."}, 500)
+
+
+# ---------- Main ----------
+
+# ASGI entry point for gunicorn -k uvicorn.workers.UvicornWorker (uvloop-backed);
+# plain WSGI (app) still works for the dev server and sync workers.
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    asgi_app = WsgiToAsgi(app)
+except ImportError:
+    asgi_app = None
+
+if __name__ == '__main__':
+    load_donor_data()
+    start_writer()
+    port = int(os.environ.get('PORT', 5000))
+    app.run(debug=True, host='0.0.0.0', port=port)
+else:
+    load_donor_data()
+    start_writer()